@@ -71,6 +71,9 @@ class Bridge:
     TTL: int = 300
     """Time to live for the request."""
 
+    TELEGRAM_URL_PATTERN: str = r"^(http[s]?://)?t.me/(\w+)"
+    """Pattern of the Telegram universal URLs."""
+
     @property
     def request_headers(self) -> dict[str, str]:
         """Request headers for the bridge."""
@@ -96,6 +99,14 @@ class Bridge:
         self.universal_url = universal_url or self.UNIVERSAL_URL
         self.crypto: SessionCrypto = SessionCrypto(private_key=private_key)
 
+        self._is_telegram_url: bool = bool(
+            self.universal_url.startswith("tg://")
+            or re.match(self.TELEGRAM_URL_PATTERN, self.universal_url)
+        )
+        self._connect_url_prefix: str = self.generate_connect_url_prefix(
+            self.crypto.public_key, universal_url=self.universal_url
+        )
+
         self.connected: asyncio.Event = asyncio.Event()
         self.connector_ready: asyncio.Event = connector_ready
         self.listener: asyncio.Task[Callable[[str], Awaitable[None]]] | None = None
@@ -119,6 +130,27 @@ class Bridge:
         """Reset crypto session."""
 
         self.crypto = SessionCrypto()
+        self._connect_url_prefix = self.generate_connect_url_prefix(
+            self.crypto.public_key, universal_url=self.universal_url
+        )
+
+    @staticmethod
+    def generate_connect_url_prefix(
+        session_id: str,
+        version: int = VERSION,
+        universal_url: str = UNIVERSAL_URL,
+    ) -> str:
+        """Generate connect URL part that doesn't depend on the request."""
+
+        universal_url = universal_url.rstrip("/")
+        return f"{universal_url}?v={version}&id={session_id}&r="
+
+    @staticmethod
+    def complete_connect_url(prefix: str, request: ConnectRequest) -> Annotated[str, AnyUrl]:
+        """Append encoded request to the connect URL prefix."""
+
+        params = quote_plus(request.model_dump_json(by_alias=True, exclude_none=True))
+        return f"{prefix}{params}&ret=back"
 
     @staticmethod
     def generate_basic_connect_url(
@@ -129,10 +161,8 @@ class Bridge:
     ) -> Annotated[str, AnyUrl]:
         """Generate basic URL for the bridge."""
 
-        params = quote_plus(request.model_dump_json(by_alias=True, exclude_none=True))
-
-        universal_url = universal_url.rstrip("/")
-        return f"{universal_url}?v={version}&id={session_id}&r={params}&ret=back"
+        prefix = Bridge.generate_connect_url_prefix(session_id, version, universal_url)
+        return Bridge.complete_connect_url(prefix, request)
 
     @staticmethod
     def convert_to_direct_link(url: str) -> str:
@@ -150,18 +180,18 @@ class Bridge:
     def generate_connect_url(
         self,
         request: ConnectRequest,
-        session_id: str,
+        session_id: str | None = None,
     ) -> Annotated[str, AnyUrl]:
-        """Generate URL for the bridge."""
+        """Generate URL for the bridge.
 
-        universal_url = self.universal_url
+        :param request: Connect request.
+        :param session_id: Session ID. Defaults to the bridge session public key.
+        """
 
-        telegram_url = r"^(http[s]?://)?t.me/(\w+)"
-
-        if universal_url.startswith("tg://") or re.match(telegram_url, universal_url):
+        if self._is_telegram_url:
             basic_url = self.generate_basic_connect_url(
                 request,
-                session_id,
+                session_id or self.crypto.public_key,
                 universal_url="",
             )
 
@@ -175,7 +205,13 @@ class Bridge:
 
             return f"{universal_url}&startapp={start_command}"
 
-        return self.generate_basic_connect_url(request, session_id, universal_url=universal_url)
+        prefix = (
+            self._connect_url_prefix
+            if session_id is None
+            else self.generate_connect_url_prefix(session_id, universal_url=self.universal_url)
+        )
+
+        return self.complete_connect_url(prefix, request)
 
     async def connect(self, request: ConnectRequest) -> Annotated[str, AnyUrl]:
         """Send request to connect to the wallet via the bridge."""
@@ -183,7 +219,7 @@ class Bridge:
         await self.disconnect(send_event=False)
         self.reset_crypto()
 
-        return self.generate_connect_url(request, self.crypto.public_key)
+        return self.generate_connect_url(request)
 
     async def disconnect(self, send_event: bool = True) -> None:
         """DisconnectEvent from the wallet."""
@@ -199,14 +235,28 @@ class Bridge:
                 )
             self.listener.cancel()
 
+    @staticmethod
+    def encode_request(request: AppRequest) -> bytes:
+        """Encode request to JSON sent to the wallet."""
+
+        return request.model_dump_json(by_alias=True, exclude_none=True).encode()
+
     async def send_request(
         self,
         request: AppRequest,
         wallet_app_key: HexBytes,
         ttl: int | None = None,
         timeout: int = 5,
+        payload: bytes | None = None,
     ) -> dict[str, Any]:
-        """Send request to the wallet."""
+        """Send request to the wallet.
+
+        :param request: Request to send.
+        :param wallet_app_key: Wallet public key.
+        :param ttl: Time to live for the request.
+        :param timeout: Timeout for sending request.
+        :param payload: Request already encoded as JSON. Encoded from request if not set.
+        """
 
         url = (
             f"{self.bridge_url}/{self.PATH_MESSAGE}?"
@@ -216,13 +266,10 @@ class Bridge:
             f"&topic={request.method.value}"
         )
 
-        data = self.crypto.encrypt(
-            request.model_dump(
-                by_alias=True,
-                exclude_none=True,
-            ),
-            wallet_app_key.hex(),
-        )
+        if payload is None:
+            payload = self.encode_request(request)
+
+        data = self.crypto.encrypt(payload, wallet_app_key.hex())
 
         async with httpx.AsyncClient(headers=self.request_headers) as client:
             response = await client.post(
@@ -1,20 +1,23 @@
 import asyncio
+import functools
 import logging
 import time
 from asyncio import Future
+from types import MappingProxyType
 from typing import (
     Any,
     Awaitable,
     Callable,
     Concatenate,
-    Iterable,
+    Coroutine,
     Literal,
+    Mapping,
     ParamSpec,
     TypeVar,
 )
 
 import httpx
-from pydantic import Field, HttpUrl, validate_call
+from pydantic import Field, HttpUrl, TypeAdapter, validate_call
 
 import ton_connect.model.app.response as app_responses
 import ton_connect.model.wallet.event as wallet_events
@@ -52,13 +55,17 @@ D = Callable[[Concatenate[TC, P], Awaitable[None]], None]
 
 LOG = logging.getLogger(__name__)
 
-EventListener = Callable[["ConnectorEvent"], Awaitable[None]]
+EventListener = Callable[["ConnectorEvent"], Coroutine[Any, Any, None]]
+DeferredCall = Callable[[], Awaitable[Any]]
+EventHandler = Callable[[Connection, BridgeMessage, list[DeferredCall]], Awaitable[bool]]
 
 P = ParamSpec("P")
-R = TypeVar("R")
 
 
 ListenerEvent = WalletEventName | Literal["heartbeat", "stopped", "app"]
+LISTENER_EVENTS: frozenset[str] = frozenset([*WalletEventName, "heartbeat", "stopped", "app"])
+
+_WALLETS_ADAPTER = TypeAdapter(list[WalletApp])
 
 
 class ConnectorEvent(BaseModel):
@@ -69,21 +76,6 @@ class ConnectorEvent(BaseModel):
     entity_id: str = Field(..., description="Entity ID")
 
 
-class Task:
-    def __init__(self, func: Callable[P, R], *args: P.args) -> None:
-        self.func = func
-        self.args = args
-
-    async def __call__(self) -> R:
-        try:
-            result = self.func(*self.args)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
-        except Exception as e:
-            LOG.error(f"Error processing task {self.func}: {e}")
-
-
 class ConnectionExistsError(Exception):
     pass
 
@@ -105,9 +97,17 @@ class ConnectionSessionNotFoundError(Exception):
 
 
 class TonConnect:
-    APPS = {}
+    APPS: dict[str, Any] = {}
     APPS_CACHE_TTL = 10 * 60
+    APPS_RETRY_DELAY = 30
+    RPC_COUNTER_FLUSH_DELAY = 0.2
+    RPC_COUNTER_RETRY_MAX_DELAY = 30
     APPS_URL = "https://raw.githubusercontent.com/ton-blockchain/wallets-list/main/wallets-v2.json"
+    APPS_LOCK = asyncio.Lock()
+
+    _client: httpx.AsyncClient | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _apps_refresh: asyncio.Task[None] | None = None
 
     def __init__(
         self,
@@ -121,19 +121,36 @@ class TonConnect:
         """
 
         self.manifest_url: HttpUrl = manifest_url
+        self._manifest_url_str: str = str(manifest_url)
         self.storage: BridgeStorage = storage
 
         self.queue: asyncio.Queue[BridgeMessage] = asyncio.Queue()
         self.bridges: dict[str, Bridge] = {}
         self.lock = asyncio.Lock()
-        self.send_lock = asyncio.Lock()
+        self._bridge_locks: dict[str, asyncio.Lock] = {}
 
-        self.listeners: dict[ListenerEvent, EventListener] = {}
+        # Replaced on every change, so dispatch always reads a consistent snapshot
+        self.listeners: Mapping[ListenerEvent, EventListener] = MappingProxyType({})
 
         self.listener_started = asyncio.Event()
         self.listener: asyncio.Task | None = None
+        self._bg_tasks: set[asyncio.Task[Any]] = set()
 
         self.rpc_response_waiters: dict[int, asyncio.Future[Any]] = {}
+        self._connections: dict[str, Connection] = {}
+        self._counter_flushes: dict[str, asyncio.Task[Any]] = {}
+        # Kept apart from cached connections, so evicting a connection can't lose unflushed IDs
+        self._rpc_counters: dict[str, int] = {}
+
+        self._event_handlers: dict[type, EventHandler] = {
+            wallet_events.ConnectSuccessEvent: self._on_connect_success,
+            wallet_events.DisconnectEvent: self._on_disconnect,
+            wallet_events.ConnectErrorEvent: self._on_disconnect,
+            app_responses.SendTransactionResponseError: self._on_rpc_response,
+            app_responses.SendTransactionSuccess: self._on_rpc_response,
+            app_responses.SignDataResponseError: self._on_rpc_response,
+            app_responses.SignDataSuccess: self._on_rpc_response,
+        }
 
     def set_bridge(self, app_name: str, bridge: Bridge) -> None:
         self.bridges[app_name] = bridge
@@ -141,17 +158,245 @@ class TonConnect:
     def get_bridge(self, app_name: str) -> Bridge | None:
         return self.bridges.get(app_name)
 
+    async def _get_connection(self, app_name: str) -> Connection | None:
+        """Get connection from memory cache, falling back to storage."""
+
+        connection = self._connections.get(app_name)
+        if connection is None:
+            connection = await self.storage.get_connection(app_name)
+            if connection is not None:
+                self._connections[app_name] = connection
+
+        return connection
+
+    async def _set_connection(self, app_name: str, connection: Connection) -> None:
+        try:
+            await self.storage.set_connection(app_name, connection)
+        except BaseException:
+            # Callers change the cached object in place, so it may hold state storage lacks
+            self._connections.pop(app_name, None)
+            raise
+
+        self._connections[app_name] = connection
+
+    async def _remove_connection(self, app_name: str) -> None:
+        self._connections.pop(app_name, None)
+        self._rpc_counters.pop(app_name, None)
+        await self.storage.remove(app_name, BridgeKey.CONNECTION)
+
+    async def _delete_app(self, app_name: str) -> None:
+        self._connections.pop(app_name, None)
+        self._rpc_counters.pop(app_name, None)
+        await self.storage.delete(app_name)
+
+    def _schedule_counter_flush(self, app_name: str, attempt: int = 0) -> None:
+        """Persist RPC request counter after a short delay, coalescing sends in between.
+
+        Request IDs issued within the last ``RPC_COUNTER_FLUSH_DELAY`` seconds are not
+        durable if the process crashes. Use :meth:`flush_rpc_counters` on shutdown.
+
+        :param app_name: Wallet app name.
+        :param attempt: Number of failed flushes so far, retries back off exponentially.
+        """
+
+        if app_name not in self._counter_flushes:
+            self._counter_flushes[app_name] = self._spawn(
+                self._flush_rpc_counter(app_name, attempt)
+            )
+
+    async def _flush_rpc_counter(self, app_name: str, attempt: int = 0) -> None:
+        delay = min(
+            self.RPC_COUNTER_FLUSH_DELAY * 2 ** min(attempt, 16),
+            self.RPC_COUNTER_RETRY_MAX_DELAY,
+        )
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Still registered means cancelled by loop shutdown, not by flush_rpc_counters
+            if self._counter_flushes.get(app_name) is asyncio.current_task():
+                del self._counter_flushes[app_name]
+                try:
+                    await self._write_rpc_counter(app_name)
+                except Exception:
+                    LOG.exception("Failed to persist RPC request counter for %s", app_name)
+            raise
+
+        # Sends after this point schedule a new flush
+        if self._counter_flushes.get(app_name) is asyncio.current_task():
+            del self._counter_flushes[app_name]
+
+        try:
+            await self._write_rpc_counter(app_name)
+        except Exception as e:
+            if attempt == 0:
+                LOG.exception("Failed to persist RPC request counter for %s. Retrying", app_name)
+            else:
+                LOG.warning(
+                    "Failed to persist RPC request counter for %s (attempt %s): %s",
+                    app_name,
+                    attempt + 1,
+                    e,
+                )
+            self._schedule_counter_flush(app_name, attempt + 1)
+
+    async def _write_rpc_counter(self, app_name: str) -> None:
+        async with self._lock_for(app_name):
+            counter = self._rpc_counters.get(app_name)
+            if counter is None:
+                return
+
+            connection = await self._get_connection(app_name)
+            if connection is None:
+                return
+
+            connection.next_rpc_request_id = max(connection.next_rpc_request_id, counter)
+            await self._set_connection(app_name, connection)
+
+    async def flush_rpc_counters(self) -> None:
+        """Persist pending RPC request counters right away."""
+
+        app_names = list(self._counter_flushes)
+        for app_name in app_names:
+            self._counter_flushes.pop(app_name).cancel()
+
+        results = await asyncio.gather(
+            *(self._write_rpc_counter(app_name) for app_name in app_names),
+            return_exceptions=True,
+        )
+        for app_name, result in zip(app_names, results, strict=True):
+            if isinstance(result, Exception):
+                LOG.error("Failed to persist RPC request counter for %s", app_name, exc_info=result)
+
+    def _lock_for(self, app_name: str) -> asyncio.Lock:
+        """Get lock for the wallet app, so different wallets don't block each other."""
+
+        lock = self._bridge_locks.get(app_name)
+        if lock is None:
+            lock = self._bridge_locks[app_name] = asyncio.Lock()
+
+        return lock
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Run coroutine in background keeping a reference until it is done."""
+
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task[Any]) -> None:
+        self._bg_tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error("Background task %s failed", task.get_name(), exc_info=task.exception())
+
     @staticmethod
     def ensure_listener(func: Decorator) -> Decorated:
         async def wrapper(self: TC, *args: P.args, **kwargs: P.kwargs) -> C:
-            async with self.lock:
-                if self.listener is None:
-                    self.listener = asyncio.create_task(self.start_listener())
-                    await self.listener_started.wait()
+            if self.listener is None:
+                async with self.lock:
+                    if self.listener is None:
+                        self.listener = asyncio.create_task(self.start_listener())
+                        await self.listener_started.wait()
             return await func(self, *args, **kwargs)
 
         return wrapper
 
+    @classmethod
+    def _bind_loop(cls) -> None:
+        """Drop shared loop-bound state created in another event loop."""
+
+        loop = asyncio.get_running_loop()
+        if cls._loop is loop:
+            return
+
+        # Pooled connections of the old loop can't be reused or closed from this one
+        cls._client = None
+        cls._apps_refresh = None
+        cls.APPS_LOCK = asyncio.Lock()
+        cls._loop = loop
+
+    @classmethod
+    async def _get_client(cls) -> httpx.AsyncClient:
+        """Get shared HTTP client, creating it on first use.
+
+        Client is bound to the running event loop and rebuilt when used from another one.
+        Call :meth:`aclose` before the loop exits to release its connections.
+        """
+
+        cls._bind_loop()
+
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=75,
+                ),
+                timeout=httpx.Timeout(10),
+            )
+
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close shared HTTP client. Must be called before the event loop exits."""
+
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def _apps_expired(cls) -> bool:
+        return cls.APPS.get("last_timestamp", 0) + cls.APPS_CACHE_TTL < time.time()
+
+    @classmethod
+    async def _refresh_wallets(cls) -> None:
+        """Fetch wallets list and update cache.
+
+        Keeps the stale list on failure and retries after ``APPS_RETRY_DELAY`` seconds.
+        """
+
+        try:
+            client = await cls._get_client()
+            response = await client.get(cls.APPS_URL)
+            response.raise_for_status()
+            response_apps = _WALLETS_ADAPTER.validate_json(response.content)
+        except Exception:
+            if "apps" not in cls.APPS:
+                raise
+
+            LOG.exception("Failed to refresh wallets list. Serving stale list")
+            cls.APPS["last_timestamp"] = time.time() - cls.APPS_CACHE_TTL + cls.APPS_RETRY_DELAY
+            return
+
+        cls.APPS["last_timestamp"] = time.time()
+        cls.APPS["apps"] = response_apps
+
+    @classmethod
+    async def _ensure_wallets(cls) -> None:
+        """Refresh wallets list if expired.
+
+        Only one refresh runs at a time. Stale list is served while refreshing,
+        only the cold start waits for the fetch.
+        """
+
+        if not cls._apps_expired():
+            return
+
+        cls._bind_loop()
+
+        async with cls.APPS_LOCK:
+            if cls._apps_expired() and (cls._apps_refresh is None or cls._apps_refresh.done()):
+                cls._apps_refresh = asyncio.create_task(cls._refresh_wallets())
+
+            refresh = cls._apps_refresh
+
+        if "apps" not in cls.APPS and refresh is not None:
+            await asyncio.shield(refresh)
+
     @classmethod
     async def get_wallets(
         cls,
@@ -171,26 +416,22 @@ class TonConnect:
         :return: List of wallet apps.
         """
 
-        if cls.APPS.get("last_timestamp", 0) + cls.APPS_CACHE_TTL < time.time():
-            async with httpx.AsyncClient() as client:
-                response = await client.get(cls.APPS_URL)
-                response_apps = [WalletApp.model_validate(wallet) for wallet in response.json()]
-                cls.APPS["last_timestamp"] = time.time()
-                cls.APPS["apps"] = response_apps
+        await cls._ensure_wallets()
 
-        apps: Iterable[WalletApp] = (app for app in cls.APPS["apps"])
+        names_set = frozenset(names or ())
+        platforms_set = frozenset(platforms or ())
+        app_names_set = frozenset(app_names or ())
+        ton_dns_set = frozenset(ton_dns or ())
 
-        apps = filter(lambda app: app.name in names, apps) if names else apps
-        apps = (
-            filter(lambda app: set(app.platforms).intersection(platforms), apps)
-            if platforms
-            else apps
-        )
-        apps = filter(lambda app: app.is_supported, apps) if only_supported else apps
-        apps = filter(lambda app: app.app_name in app_names, apps) if app_names else apps
-        apps = filter(lambda app: app.dns in ton_dns, apps) if ton_dns else apps
-
-        return list(apps)
+        return [
+            app
+            for app in cls.APPS["apps"]
+            if (not names_set or app.name in names_set)
+            and (not platforms_set or not platforms_set.isdisjoint(app.platforms))
+            and (not only_supported or app.is_supported)
+            and (not app_names_set or app.app_name in app_names_set)
+            and (not ton_dns_set or app.dns in ton_dns_set)
+        ]
 
     @ensure_listener
     @validate_call
@@ -202,8 +443,8 @@ class TonConnect:
         :return: Connection URL.
         """
 
-        async with self.lock:
-            connection = await self.storage.get_connection(wallet.app_name)
+        async with self._lock_for(wallet.app_name):
+            connection = await self._get_connection(wallet.app_name)
             if connection is not None and connection.connect_event:
                 raise ConnectionExistsError(
                     "Connection already exists. Use restore_connection method."
@@ -214,7 +455,7 @@ class TonConnect:
                 await bridge.disconnect(send_event=True)
                 await asyncio.sleep(0.2)
 
-            await self.storage.delete(wallet.app_name)
+            await self._delete_app(wallet.app_name)
             await self.storage.insert(wallet.app_name, BridgeData())
 
             ready = asyncio.Event()
@@ -234,7 +475,7 @@ class TonConnect:
 
             if connection is None:
                 session = Session(
-                    private_key=bridge.crypto.private_key.encode().hex(),
+                    private_key=bridge.crypto.private_key_hex,
                     bridge_url=bridge.bridge_url,
                 )
 
@@ -243,7 +484,7 @@ class TonConnect:
                     source=wallet.app_name,
                 )
 
-            await self.storage.set_connection(wallet.app_name, connection)
+            await self._set_connection(wallet.app_name, connection)
 
             request_items: list[TonAddressRequestItem | TonProofRequestItem] = [
                 TonAddressRequestItem()
@@ -251,18 +492,18 @@ class TonConnect:
             if ton_proof:
                 request_items.append(ton_proof)
 
-            request = ConnectRequest(manifest_url=str(self.manifest_url), items=request_items)
+            request = ConnectRequest(manifest_url=self._manifest_url_str, items=request_items)
             ready.set()
 
-            return bridge.generate_connect_url(request, bridge.crypto.public_key)
+            return bridge.generate_connect_url(request)
 
     @ensure_listener
     @validate_call
     async def restore_connection(self, wallet: WalletApp) -> Bridge:
         """Restore connection to the wallet."""
 
-        async with self.lock:
-            connection = await self.storage.get_connection(wallet.app_name)
+        async with self._lock_for(wallet.app_name):
+            connection = await self._get_connection(wallet.app_name)
             if not connection:
                 LOG.info("Connection not found for %s. Use .connect", wallet.app_name)
                 raise ConnectionNotFoundError()
@@ -305,66 +546,90 @@ class TonConnect:
 
             return bridge
 
+    async def _on_heartbeat(self, message: BridgeMessage) -> None:
+        LOG.debug("Heartbeat received")
+        await self.storage.set(message.app_name, BridgeKey.HEARTBEAT, int(time.time()))
+
+    async def _on_stopped(self, message: BridgeMessage) -> None:
+        LOG.info("Bridge %s stopped", message.app_name)
+        self.bridges.pop(message.app_name)
+        await self._remove_connection(message.app_name)
+
+    async def _on_connect_success(
+        self,
+        connection: Connection,
+        message: BridgeMessage,
+        tasks: list[DeferredCall],
+    ) -> bool:
+        connection.last_wallet_event_id = message.event.id
+        if message.event.payload.find_item_by_type(TonAddressItem) is not None:
+            connection.session.wallet_key = message.source
+            connection.connect_event = message.event
+        await self._set_connection(message.app_name, connection)
+
+        return True
+
+    async def _on_disconnect(
+        self,
+        connection: Connection,
+        message: BridgeMessage,
+        tasks: list[DeferredCall],
+    ) -> bool:
+        LOG.info("Disconnecting from %s for %s", message.app_name, self.storage.entity_id)
+
+        bridge = self.get_bridge(message.app_name)
+        tasks.append(bridge.disconnect)
+        tasks.append(functools.partial(self._delete_app, message.app_name))
+
+        return True
+
+    async def _on_rpc_response(
+        self,
+        connection: Connection,
+        message: BridgeMessage,
+        tasks: list[DeferredCall],
+    ) -> bool:
+        if message.event.id in self.rpc_response_waiters:
+            # Targeted responses are not handled by listeners
+            self.rpc_response_waiters.pop(message.event.id).set_result(message)
+            return False
+        elif self.listeners.get("app") is None:
+            LOG.error(
+                "Unexpected App message: %s. "
+                "Register `app` listener to handling wallet app events",
+                message,
+            )
+
+        connection.last_rpc_event_id = message.event.id
+
+        return True
+
     async def handle_message(self, connection: Connection, message: BridgeMessage) -> None:
         """Handle queue message."""
 
-        int_tasks: list[Task] = []
+        int_tasks: list[DeferredCall] = []
 
-        if message.event != "heartbeat":
-            LOG.info("Handling message: %s", message)
+        if message.event == "heartbeat":
+            await self._on_heartbeat(message)
+            return
 
-        match message.event:
-            case "heartbeat":
-                LOG.debug("Heartbeat received")
-                await self.storage.set(message.app_name, BridgeKey.HEARTBEAT, int(time.time()))
-                return
+        LOG.info("Handling message: %s", message)
 
-            case "stopped":
-                LOG.info("Bridge %s stopped", message.app_name)
-                self.bridges.pop(message.app_name)
-                await self.storage.remove(message.app_name, BridgeKey.CONNECTION)
-                return
+        if message.event == "stopped":
+            await self._on_stopped(message)
+            return
 
-            case wallet_events.ConnectSuccessEvent():
-                connection.last_wallet_event_id = message.event.id
-                if message.event.payload.find_item_by_type(TonAddressItem) is not None:
-                    connection.session.wallet_key = message.source
-                    connection.connect_event = message.event
-                await self.storage.set_connection(message.app_name, connection)
-
-            case wallet_events.DisconnectEvent() | wallet_events.ConnectErrorEvent():
-                LOG.info("Disconnecting from %s for %s", message.app_name, self.storage.entity_id)
-
-                bridge = self.get_bridge(message.app_name)
-                int_tasks.append(Task(bridge.disconnect))
-                int_tasks.append(Task(self.storage.delete, message.app_name))
-
-            case (
-                app_responses.SendTransactionResponseError()
-                | app_responses.SendTransactionSuccess()
-                | app_responses.SignDataResponseError()
-                | app_responses.SignDataSuccess()
-            ):
-                if message.event.id in self.rpc_response_waiters:
-                    # Targeted responses are not handled by listeners
-                    self.rpc_response_waiters.pop(message.event.id).set_result(message)
-                    return
-                elif self.listeners.get("app") is None:
-                    LOG.error(
-                        "Unexpected App message: %s. "
-                        "Register `app` listener to handling wallet app events",
-                        message,
-                    )
-
-                connection.last_rpc_event_id = message.event.id
-
-            case _:
-                LOG.error(f"Unhandled event: {message.event}")
+        handler = self._event_handlers.get(type(message.event))
+        if handler is None:
+            LOG.error(f"Unhandled event: {message.event}")
+        elif not await handler(connection, message, int_tasks):
+            return
 
         event_name = "app" if isinstance(message.event, AppResponses) else message.event.name
 
-        if event_name in self.listeners:
-            connection = await self.storage.get_connection(message.app_name)
+        listener = self.listeners.get(event_name)
+        if listener is not None:
+            connection = await self._get_connection(message.app_name)
 
             account = None
             device = None
@@ -380,12 +645,72 @@ class TonConnect:
                 account=account,
                 entity_id=self.storage.entity_id,
             )
-            asyncio.create_task(self.listeners[event_name](connector_event))
+            # Listeners run in background so slow handlers don't block the queue
+            self._spawn(listener(connector_event))
         elif isinstance(message.event, WalletEventType):
             LOG.error(f"Unhandled event: {message.event}")
 
-        for task in int_tasks:
-            asyncio.create_task(task())
+        if int_tasks:
+            # Runs in background so handling timeout can't cancel cleanup halfway
+            self._spawn(self._run_deferred(int_tasks))
+
+    async def _run_deferred(self, tasks: list[DeferredCall]) -> None:
+        """Run follow-up calls concurrently, logging each failure."""
+
+        results = await asyncio.gather(*(task() for task in tasks), return_exceptions=True)
+        for task, result in zip(tasks, results, strict=True):
+            if isinstance(result, Exception):
+                LOG.error("Error processing task %s", task, exc_info=result)
+
+    async def _process_message(self, message: BridgeMessage) -> None:
+        LOG.debug(f"Event received: {message}")
+
+        async with self._lock_for(message.app_name):
+            connection = await self._get_connection(message.app_name)
+            if connection is None:
+                LOG.error(f"Connection not found for {message.app_name}")
+                await self.bridges.get(message.app_name).disconnect(send_event=False)
+                LOG.info(f"Bridge {message.app_name} stopped")
+                return
+
+            # 5 Seconds timeout for handling message so we can continue to listen
+            await asyncio.wait_for(
+                self.handle_message(connection, message),
+                timeout=5,
+            )
+
+    async def _process_messages(self, messages: list[BridgeMessage]) -> None:
+        """Process messages of a single wallet in order.
+
+        Messages are taken off the list as they are processed, so the ones left after
+        cancellation were never started.
+        """
+
+        while messages:
+            message = messages.pop(0)
+            try:
+                await self._process_message(message)
+            except Exception:
+                LOG.exception("Error processing event: %s", message)
+            finally:
+                self.queue.task_done()
+
+    def _requeue(self, messages: list[BridgeMessage]) -> None:
+        """Put unprocessed messages back to the front of the queue for the next listener."""
+
+        if not messages:
+            return
+
+        while True:
+            try:
+                messages.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        for message in messages:
+            self.queue.put_nowait(message)
+            # Balances the original get(), the message is unfinished again after put
+            self.queue.task_done()
 
     async def start_listener(self) -> None:
         """Listen for wallet events."""
@@ -394,32 +719,27 @@ class TonConnect:
 
         self.listener_started.set()
 
+        by_app: dict[str, list[BridgeMessage]] = {}
+
         try:
             while True:
-                try:
-                    message = await self.queue.get()
-                    LOG.debug(f"Event received: {message}")
-
-                    async with self.lock:
-                        connection = await self.storage.get_connection(message.app_name)
-                        if connection is None:
-                            LOG.error(f"Connection not found for {message.app_name}")
-                            await self.bridges.get(message.app_name).disconnect(send_event=False)
-                            LOG.info(f"Bridge {message.app_name} stopped")
-                            continue
-
-                        # 5 Seconds timeout for handling message so we can continue to listen
-                        await asyncio.wait_for(
-                            self.handle_message(connection, message),
-                            timeout=5,
-                        )
-
-                except Exception as e:
-                    LOG.exception(f"Error processing event: {message} {type(e)}({e})")
-                else:
-                    self.queue.task_done()
+                messages = [await self.queue.get()]
+                while True:
+                    try:
+                        messages.append(self.queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Messages of the same wallet keep their order, different wallets run concurrently
+                by_app = {}
+                for message in messages:
+                    by_app.setdefault(message.app_name, []).append(message)
+
+                await asyncio.gather(*(self._process_messages(batch) for batch in by_app.values()))
 
         except asyncio.CancelledError:
+            self._requeue([message for batch in by_app.values() for message in batch])
+            await self.flush_rpc_counters()
             LOG.debug("TonConnector event listener stopped. Stopping bridge listeners...")
             for bridge in self.bridges.values():
                 await bridge.disconnect(send_event=False)
@@ -428,14 +748,15 @@ class TonConnect:
             self.listener_started.clear()
 
     async def stop_listener(self) -> None:
-        """Stop listener."""
+        """Stop listener and persist pending RPC request counters."""
 
         if self.listener is not None:
             self.listener.cancel()
             await self.listener
 
+        await self.flush_rpc_counters()
+
     @ensure_listener
-    @validate_call
     async def listen(
         self,
         event: ListenerEvent,
@@ -447,12 +768,23 @@ class TonConnect:
         :param handler: Event handler.
         """
 
+        if event not in LISTENER_EVENTS:
+            raise ValueError(f"Unknown event {event}")
+
+        if not callable(handler):
+            raise TypeError(f"Handler for {event} is not callable")
+
         if event in self.listeners:
             raise ValueError(f"Event {event} is already registered")
 
-        self.listeners[event] = handler
+        self.listeners = MappingProxyType({**self.listeners, event: handler})
+
+    @staticmethod
+    def encode_request(request: AppRequestType) -> bytes:
+        """Encode request to JSON sent to the wallet."""
+
+        return Bridge.encode_request(request)
 
-    @validate_call
     async def send(
         self,
         app_name: str,
@@ -466,40 +798,54 @@ class TonConnect:
         :param request: Request to send.
         :param wait_response: Wait for response. Return task if True.
         :param timeout: Timeout for sending request.
+
+        Request ID counter is persisted lazily, call :meth:`stop_listener` or
+        :meth:`flush_rpc_counters` before exiting so the IDs are not issued again.
         """
 
-        async with self.send_lock:
+        async with self._lock_for(app_name):
             bridge = self.get_bridge(app_name)
             if bridge is None:
                 raise Exception("Bridge not found")
 
-            connection = await self.storage.get_connection(app_name)
+            connection = await self._get_connection(app_name)
             if connection is None:
                 raise RuntimeError("Connection not found")
 
-            request.id = connection.next_rpc_request_id
-            connection.next_rpc_request_id += 1
+            # Stored counter may lag behind the in-memory one until it is flushed
+            request.id = max(
+                connection.next_rpc_request_id,
+                self._rpc_counters.get(app_name, 0),
+            )
+            connection.next_rpc_request_id = self._rpc_counters[app_name] = request.id + 1
 
-            await self.storage.set_connection(app_name, connection)
+            # Connection is cached in memory, so the counter is only persisted lazily
+            self._schedule_counter_flush(app_name)
 
-            ttl = 5 * 60
+            # Register waiter before sending so a fast response is not missed
+            ready: asyncio.Future[app_responses.AppResponses] | None = None
+            if wait_response:
+                ready = Future()
+                self.rpc_response_waiters[request.id] = ready
 
+        ttl = 5 * 60
+
+        try:
             response = await bridge.send_request(
                 request,
                 wallet_app_key=connection.session.wallet_key,
                 ttl=ttl,
                 timeout=timeout,
+                payload=self.encode_request(request),
             )
+        except BaseException:
+            self.rpc_response_waiters.pop(request.id, None)
+            raise
 
         LOG.info("Got response for request %s: %s", request.id, response)
 
-        if response["statusCode"] == 200 and wait_response:
-            ready: asyncio.Future[app_responses.AppResponses] = Future()
-            self.rpc_response_waiters[request.id] = ready
-
-            return ready
-
-        elif response["statusCode"] != 200:
+        if response["statusCode"] != 200:
+            self.rpc_response_waiters.pop(request.id, None)
             raise RPCError(response)
 
-        return None
+        return ready
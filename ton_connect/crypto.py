@@ -19,16 +19,17 @@ class SessionCrypto:
             private_key = PrivateKey.generate()
 
         self.private_key: PrivateKey = private_key
+        self.private_key_hex: str = self.private_key.encode().hex()
         self.public_key: str = self.private_key.public_key.encode().hex()
 
     @staticmethod
     def generate_nonce() -> bytes:
         return random(Box.NONCE_SIZE)
 
-    def encrypt(self, data: dict[str, Any], pub_key: PublicKey | str | bytes) -> bytes:
+    def encrypt(self, data: dict[str, Any] | bytes, pub_key: PublicKey | str | bytes) -> bytes:
         """Encrypt data with public private_key
 
-        :param data: Data to encrypt.
+        :param data: Data to encrypt. Either a JSON serializable dict or already encoded JSON.
         :param pub_key: Recipient public private_key.
         :return: Encrypted data.
         """
@@ -39,7 +40,10 @@ class SessionCrypto:
 
         box = Box(self.private_key, pub_key)
         nonce = self.generate_nonce()
-        encrypted_data = box.encrypt(json.dumps(data).encode(), nonce)
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode()
+
+        encrypted_data = box.encrypt(data, nonce)
 
         return base64.b64encode(nonce + encrypted_data.ciphertext)
 
@@ -63,6 +63,35 @@ class AppRequest(BaseModel, Generic[_Method]):
             serialize_as_any=serialize_as_any,
         )
 
+    def model_dump_json(  # type: ignore[override]
+        self,
+        *,
+        indent: int | None = None,
+        include: IncEx | None = None,
+        exclude: IncEx | None = None,
+        context: dict[str, Any] | None = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool | Literal["none", "warn", "error"] = True,
+        serialize_as_any: bool = False,
+    ) -> str:
+        return super().model_dump_json(
+            indent=indent,
+            include={"id", "method", "params"},
+            exclude=exclude,
+            context=context,
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_defaults=exclude_defaults,
+            exclude_unset=exclude_unset,
+            round_trip=round_trip,
+            warnings=warnings,
+            serialize_as_any=serialize_as_any,
+        )
+
 
 class SignDataParams(BaseModel):
     schema_crc: int = Field(..., description="Schema version", alias="schema_crc")